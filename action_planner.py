@@ -87,6 +87,11 @@ class ActionPlanner:
     def is_enabled(self) -> bool:
         return bool(self.enabled)
 
+    def shutdown(self):
+        """Stop the skill combo worker thread (if one was started)."""
+        if self.skill_combo_manager is not None:
+            self.skill_combo_manager.shutdown()
+
     def _find_target_mob(self, detections: List[Dict]) -> Optional[Dict]:
         # priority: mob_oncursor, mob_near, mob_away
         priority = ["mob_oncursor", "mob_near", "mob_away"]
@@ -246,6 +251,13 @@ class ActionPlanner:
         if not self.enabled:
             return
         
+        # A combo playing on the background worker (COMBO_EXECUTION_BACKGROUND)
+        # owns the keyboard and mouse until it finishes: keep detecting, but
+        # send no clicks, keys or movement this tick
+        if self.skill_combo_manager is not None and self.skill_combo_manager.is_combo_in_flight():
+            logger.debug("Combo still playing - skipping actions this tick")
+            return
+        
         now = time.time()
         
         # Check if we're in idle simulation state
@@ -60,6 +60,7 @@ class DetectionController:
         self.log("Stopping detection")
         self._running.clear()
         self.capture.stop_capture()
+        self.action_planner.shutdown()
 
     def _run(self):
         interval = 1.0 / max(1, self.fps)
@@ -213,6 +213,7 @@ class MainWindow(QtWidgets.QMainWindow):
             skill_combo_config.ATTACK_MODE_WEIGHTS['standard_attack'] = self.standard_attack_weight.value()
             skill_combo_config.ATTACK_MODE_WEIGHTS['single_skill'] = self.single_skill_weight.value()
             skill_combo_config.ATTACK_MODE_WEIGHTS['combo_set'] = self.combo_set_weight.value()
+            skill_combo_config.refresh_configuration()
             
             # Update health requirement
             skill_combo_config.REQUIRE_MOB_HEALTH_FOR_SKILLS = self.require_health_cb.isChecked()
@@ -778,6 +779,7 @@ class SkillEditorDialog(QtWidgets.QDialog):
                     new_cooldowns[keybind] = cooldown
         
         self.config.SKILL_COOLDOWNS = new_cooldowns
+        self.config.refresh_configuration()
         
         # Save to file for persistence
         self._save_config_to_file()
@@ -1003,6 +1005,7 @@ class ComboEditorDialog(QtWidgets.QDialog):
             'enabled': True,
         }
         self.config.COMBO_SETS.append(new_combo)
+        self.config.refresh_configuration()
         self._load_combo_list()
         self.combo_list.setCurrentRow(len(self.config.COMBO_SETS) - 1)
     
@@ -1023,6 +1026,7 @@ class ComboEditorDialog(QtWidgets.QDialog):
             
             if reply == QtWidgets.QMessageBox.Yes:
                 del self.config.COMBO_SETS[current_row]
+                self.config.refresh_configuration()
                 self._save_combos_to_file()
                 self._load_combo_list()
                 self.combo_name_edit.clear()
@@ -1055,6 +1059,7 @@ class ComboEditorDialog(QtWidgets.QDialog):
         # Parse skills
         skills_text = self.combo_skills_edit.toPlainText().strip()
         combo['skills'] = [s.strip() for s in skills_text.split("\n") if s.strip()]
+        self.config.refresh_configuration()
         
         self._load_combo_list()
         self.combo_list.setCurrentRow(self.current_combo_index)
@@ -7,7 +7,8 @@ Highly configurable skill combo system with:
 - Flexible key combinations (1-9, 0, -, =, Alt+, Ctrl+)
 """
 import time
-from typing import List, Dict, Tuple, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Tuple, Optional, FrozenSet
 from loguru import logger
 import random
 
@@ -122,6 +123,12 @@ SKILL_COMBO_ENABLED = True
 # If not specified, will try combos in the order they appear in COMBO_SETS
 COMBO_PRIORITY = None  # None = use default order, or [2, 0, 1] for custom priority
 
+# Play combos on a background worker thread so the caller (the detection loop)
+# is not blocked for the delays between skills. Cooldowns are still started
+# when the combo is scheduled, at the time each skill is due to fire. While the
+# combo plays, detection continues but no other clicks or keys are sent.
+COMBO_EXECUTION_BACKGROUND = False
+
 # ============================================================================
 # STEALTH ATTACK MODE CONFIGURATION
 # ============================================================================
@@ -155,10 +162,113 @@ SINGLE_SKILL_GLOBAL_COOLDOWN = 1.5  # GCD between single skill uses
 # HELPER FUNCTIONS
 # ============================================================================
 
+@dataclass(frozen=True)
+class Combo:
+    """Read-only, pre-parsed form of a COMBO_SETS entry used at runtime."""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10+
+    __slots__ = ('name', 'skills', 'skills_lower', 'skill_ids', 'mask', 'parsed',
+                 'cooldown', 'cooldown_ns', 'delay_between_skills', 'enabled')
+
+    name: str
+    skills: Tuple[str, ...]
+    skills_lower: Tuple[str, ...]
+    skill_ids: Tuple[int, ...]
+    mask: int  # bit i set for every skill id i in skill_ids
+    parsed: Tuple[Tuple[Optional[str], str], ...]
+    cooldown: float
+    cooldown_ns: int  # cooldown in time.monotonic_ns() units
+    delay_between_skills: float
+    enabled: bool
+
+    @classmethod
+    def from_dict(cls, combo: Dict) -> 'Combo':
+        """Build a Combo from a COMBO_SETS dictionary, applying defaults."""
+        skills = tuple(combo.get('skills', []))
+        skill_ids = tuple(intern_skill(skill) for skill in skills)
+        cooldown = combo.get('cooldown', 60.0)
+        return cls(
+            name=combo.get('name', 'unnamed'),
+            skills=skills,
+            skills_lower=tuple(skill.lower() for skill in skills),
+            skill_ids=skill_ids,
+            mask=skill_mask(skill_ids),
+            parsed=tuple(get_parsed_skill(skill) for skill in skills),
+            cooldown=cooldown,
+            cooldown_ns=int(cooldown * 1e9),
+            delay_between_skills=combo.get('delay_between_skills', 0.5),
+            enabled=combo.get('enabled', True),
+        )
+
+
+# Cached results derived from the settings above. Filled in lazily and
+# cleared by refresh_configuration() whenever the settings are edited.
+_VALIDATION_CACHE: Optional[bool] = None
+_KNOWN_SKILLS: Optional[FrozenSet[str]] = None
+_ENABLED_COMBOS: Optional[List[Combo]] = None
+
+# Attack mode sampling tables, rebuilt from ATTACK_MODE_WEIGHTS by
+# refresh_configuration(). Sample with bisect_right(cumweights, random()).
+ATTACK_MODE_MODES: Tuple[str, ...] = ()
+ATTACK_MODE_CUMWEIGHTS: Tuple[float, ...] = ()
+
+# Same tables restricted to the modes that are actionable for each
+# (single_ready, combo_ready) combination
+ACTIONABLE_MODE_TABLES: Dict[Tuple[bool, bool], Tuple[Tuple[str, ...], Tuple[float, ...]]] = {}
+
+# Lowercase keybinds eligible for single skill attacks (SINGLE_SKILL_POOL,
+# or every configured skill if the pool is empty), and their skill ids
+SINGLE_SKILL_POOL_LOWER: Tuple[str, ...] = ()
+SINGLE_SKILL_POOL_IDS: Tuple[int, ...] = ()
+SINGLE_SKILL_POOL_MASK = 0
+
+# Lowercase keybind <-> small integer id used to index per-skill arrays.
+# Ids are only ever added (never reassigned), so they stay valid across
+# refresh_configuration(). Use intern_skill() to look up or assign one.
+SKILL_IDS: Dict[str, int] = {}
+SKILL_NAMES: List[str] = []
+
+# SKILL_COOLDOWNS keyed by lowercase keybind, in seconds and in integer
+# nanoseconds (for time.monotonic_ns() arithmetic); rebuilt by refresh_configuration()
+SKILL_COOLDOWN_TABLE: Dict[str, float] = {}
+SKILL_COOLDOWN_NS: Dict[str, int] = {}
+
+# Cooldown used for keybinds missing from SKILL_COOLDOWNS (seconds)
+DEFAULT_SKILL_COOLDOWN = 10.0
+DEFAULT_SKILL_COOLDOWN_NS = int(DEFAULT_SKILL_COOLDOWN * 1e9)
+
+# Lowercase keybind -> parse_skill_keybind() result for every configured skill
+PARSED_SKILLS: Dict[str, Tuple[Optional[str], str]] = {}
+
+
+def _known_skills() -> FrozenSet[str]:
+    """Get the set of configured skill keybinds."""
+    global _KNOWN_SKILLS
+    if _KNOWN_SKILLS is None:
+        _KNOWN_SKILLS = frozenset(SKILL_COOLDOWNS)
+    return _KNOWN_SKILLS
+
+
+def intern_skill(skill: str) -> int:
+    """Get the id of a skill keybind, assigning the next free id if it has none."""
+    skill_lower = skill.lower()
+    skill_id = SKILL_IDS.get(skill_lower)
+    if skill_id is None:
+        skill_id = SKILL_IDS[skill_lower] = len(SKILL_NAMES)
+        SKILL_NAMES.append(skill_lower)
+    return skill_id
+
+
+def skill_mask(skill_ids) -> int:
+    """Get a bitmask with bit i set for every skill id i."""
+    mask = 0
+    for skill_id in skill_ids:
+        mask |= 1 << skill_id
+    return mask
+
+
 def get_skill_cooldown(skill: str) -> float:
     """Get the cooldown for a specific skill keybind."""
-    skill_lower = skill.lower()
-    return SKILL_COOLDOWNS.get(skill_lower, 10.0)  # Default 10s if not found
+    return SKILL_COOLDOWN_TABLE.get(skill.lower(), DEFAULT_SKILL_COOLDOWN)
 
 
 def get_randomized_delay(base_delay: float) -> float:
@@ -179,9 +289,12 @@ def get_enabled_combo_sets() -> List[Dict]:
                 if 0 <= idx < len(enabled):
                     ordered.append(enabled[idx])
             # Add any combos not in priority list
+            # (dicts are unhashable, so track them by identity)
+            seen_ids = {id(combo) for combo in ordered}
             for combo in enabled:
-                if combo not in ordered:
+                if id(combo) not in seen_ids:
                     ordered.append(combo)
+                    seen_ids.add(id(combo))
             return ordered
         except Exception as e:
             logger.warning(f"Invalid COMBO_PRIORITY, using default order: {e}")
@@ -189,6 +302,95 @@ def get_enabled_combo_sets() -> List[Dict]:
     return enabled
 
 
+def _cumulative_weights(weights: Dict[str, float]) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+    """Turn {mode: weight} into (modes, cumulative weights normalized to 1.0).
+    
+    Modes with a non-positive weight are dropped. If no weight is positive,
+    the modes are used with equal weight instead.
+    """
+    positive = [(mode, float(w)) for mode, w in weights.items() if w > 0]
+    if not positive:
+        positive = [(mode, 1.0) for mode in weights]
+    if not positive:
+        return (), ()
+    
+    total = sum(w for _, w in positive)
+    cumweights = []
+    running = 0.0
+    for _, w in positive:
+        running += w
+        cumweights.append(running / total)
+    cumweights[-1] = 1.0  # guard against rounding leaving the last bucket short
+    return tuple(mode for mode, _ in positive), tuple(cumweights)
+
+
+def _build_attack_mode_tables():
+    """Precompute the attack mode distributions from ATTACK_MODE_WEIGHTS."""
+    global ATTACK_MODE_MODES, ATTACK_MODE_CUMWEIGHTS, ACTIONABLE_MODE_TABLES
+    ATTACK_MODE_MODES, ATTACK_MODE_CUMWEIGHTS = _cumulative_weights(ATTACK_MODE_WEIGHTS)
+    
+    tables = {}
+    for single_ready in (False, True):
+        for combo_ready in (False, True):
+            candidates = {}
+            for mode, w in ATTACK_MODE_WEIGHTS.items():
+                if mode == 'single_skill' and not single_ready:
+                    continue
+                if mode == 'combo_set' and not combo_ready:
+                    continue
+                candidates[mode] = max(0.0, float(w))
+            
+            if candidates and sum(candidates.values()) <= 0:
+                # All weights zero: treat every mode as equally likely
+                candidates = {'single_skill': 1.0, 'combo_set': 1.0, 'standard_attack': 1.0}
+            elif not candidates:
+                # No weighted candidate is ready; pick best available fallback
+                if single_ready:
+                    candidates = {'single_skill': 1.0}
+                elif combo_ready:
+                    candidates = {'combo_set': 1.0}
+                else:
+                    candidates = {'standard_attack': 1.0}
+            
+            tables[(single_ready, combo_ready)] = _cumulative_weights(candidates)
+    ACTIONABLE_MODE_TABLES = tables
+
+
+_build_attack_mode_tables()
+
+
+def _build_single_skill_pool():
+    """Precompute the lowercase single skill pool and its skill ids."""
+    global SINGLE_SKILL_POOL_LOWER, SINGLE_SKILL_POOL_IDS, SINGLE_SKILL_POOL_MASK
+    pool = SINGLE_SKILL_POOL or SKILL_COOLDOWNS
+    SINGLE_SKILL_POOL_LOWER = tuple(skill.lower() for skill in pool)
+    SINGLE_SKILL_POOL_IDS = tuple(intern_skill(skill) for skill in pool)
+    SINGLE_SKILL_POOL_MASK = skill_mask(SINGLE_SKILL_POOL_IDS)
+
+
+_build_single_skill_pool()
+
+
+def _build_skill_cooldown_table():
+    """Precompute SKILL_COOLDOWNS keyed by lowercase keybind and intern the keybinds."""
+    global SKILL_COOLDOWN_TABLE, SKILL_COOLDOWN_NS
+    SKILL_COOLDOWN_TABLE = {skill.lower(): float(cd) for skill, cd in SKILL_COOLDOWNS.items()}
+    SKILL_COOLDOWN_NS = {skill: int(cd * 1e9) for skill, cd in SKILL_COOLDOWN_TABLE.items()}
+    for skill_lower in SKILL_COOLDOWN_TABLE:
+        intern_skill(skill_lower)
+
+
+_build_skill_cooldown_table()
+
+
+def get_enabled_combos() -> List[Combo]:
+    """Get all enabled combo sets in priority order as Combo objects."""
+    global _ENABLED_COMBOS
+    if _ENABLED_COMBOS is None:
+        _ENABLED_COMBOS = [Combo.from_dict(combo) for combo in get_enabled_combo_sets()]
+    return _ENABLED_COMBOS
+
+
 def validate_combo_set(combo: Dict) -> Tuple[bool, str]:
     """Validate a combo set configuration.
     
@@ -205,9 +407,10 @@ def validate_combo_set(combo: Dict) -> Tuple[bool, str]:
         return False, "Combo 'skills' must be a non-empty list"
     
     # Validate each skill exists in SKILL_COOLDOWNS
+    known_skills = _known_skills()
     for skill in combo['skills']:
         skill_lower = skill.lower()
-        if skill_lower not in SKILL_COOLDOWNS:
+        if skill_lower not in known_skills:
             return False, f"Unknown skill keybind: {skill}"
     
     if 'cooldown' in combo and combo['cooldown'] < 0:
@@ -242,6 +445,20 @@ def parse_skill_keybind(skill: str) -> Tuple[Optional[str], str]:
         return (None, skill_lower)
 
 
+def get_parsed_skill(skill: str) -> Tuple[Optional[str], str]:
+    """Get (modifier, key) for a keybind, from PARSED_SKILLS when configured."""
+    return PARSED_SKILLS.get(skill.lower()) or parse_skill_keybind(skill)
+
+
+def _build_parsed_skills():
+    """Pre-parse every configured keybind."""
+    global PARSED_SKILLS
+    PARSED_SKILLS = {skill.lower(): parse_skill_keybind(skill) for skill in SKILL_COOLDOWNS}
+
+
+_build_parsed_skills()
+
+
 # ============================================================================
 # CONFIGURATION VALIDATION
 # ============================================================================
@@ -249,9 +466,16 @@ def parse_skill_keybind(skill: str) -> Tuple[Optional[str], str]:
 def validate_configuration() -> bool:
     """Validate the entire configuration on startup.
     
+    The result is cached until refresh_configuration() is called, so
+    creating several managers only validates once.
+    
     Returns:
         True if configuration is valid, False otherwise
     """
+    global _VALIDATION_CACHE
+    if _VALIDATION_CACHE is not None:
+        return _VALIDATION_CACHE
+    
     logger.info("Validating skill combo configuration...")
     
     errors = []
@@ -271,12 +495,34 @@ def validate_configuration() -> bool:
         logger.error("Skill combo configuration errors:")
         for error in errors:
             logger.error(f"  - {error}")
+        _VALIDATION_CACHE = False
         return False
     
     logger.success(f"✓ Skill combo configuration valid ({len(COMBO_SETS)} combo sets)")
+    _VALIDATION_CACHE = True
+    
+    # Build the runtime combo objects now rather than on the first check
+    get_enabled_combos()
     return True
 
 
+def refresh_configuration():
+    """Discard cached validation results after the configuration is edited.
+    
+    Call this after changing SKILL_COOLDOWNS, COMBO_SETS,
+    SINGLE_SKILL_POOL or ATTACK_MODE_WEIGHTS at runtime (e.g. from the
+    GUI editors) so the next check sees the new values.
+    """
+    global _VALIDATION_CACHE, _KNOWN_SKILLS, _ENABLED_COMBOS
+    _VALIDATION_CACHE = None
+    _KNOWN_SKILLS = None
+    _ENABLED_COMBOS = None
+    _build_attack_mode_tables()
+    _build_single_skill_pool()
+    _build_skill_cooldown_table()
+    _build_parsed_skills()
+
+
 # ============================================================================
 # USER CONFIGURATION GUIDE
 # ============================================================================
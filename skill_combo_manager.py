@@ -8,16 +8,119 @@ This manager:
 - Supports stealth attack mode (randomized between double-click, single skill, combo)
 """
 import time
+import heapq
 import random
-from typing import Dict, Optional, List, Tuple
+import ctypes
+import threading
+from array import array
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import repeat
+from typing import Callable, Dict, Optional, List, Sequence, Tuple
 from loguru import logger
 import skill_combo_config
-from input_controller import focus_window, tap_key, hold_key
+from skill_combo_config import Combo
+from input_controller import (focus_window, is_window_foreground, tap_key, hold_key,
+                              press_key_combination)
+
+
+# Number of attack mode decisions pre-sampled at a time when every mode is actionable
+_DECISION_PLAN_SIZE = 16
+
+# Keybind -> zero-arg callable that sends the input for that skill.
+# A keybind always maps to the same input, so entries never go stale.
+_SKILL_HANDLERS: Dict[str, Callable[[], None]] = {}
+
+
+# Modifier (as returned by parse_skill_keybind) -> builder for the input handler
+# of a key pressed with that modifier
+_MODIFIER_DISPATCH: Dict[Optional[str], Callable[[str], Callable[[], None]]] = {
+    None: lambda key: partial(tap_key, key),
+    # Hold modifier, press key, release modifier
+    'alt': lambda key: partial(press_key_combination, 'alt', key),
+    'ctrl': lambda key: partial(press_key_combination, 'ctrl', key),
+}
+
+
+def _skill_handler(skill_lower: str) -> Callable[[], None]:
+    """Return (and cache) the input handler for a lowercase skill keybind."""
+    modifier, key = skill_combo_config.get_parsed_skill(skill_lower)
+    handler = _MODIFIER_DISPATCH[modifier](key)
+    _SKILL_HANDLERS[skill_lower] = handler
+    return handler
+
+
+# Windows multimedia timer API (unavailable on other platforms)
+try:
+    _winmm = ctypes.windll.winmm
+except (AttributeError, OSError):
+    _winmm = None
+
+
+@contextmanager
+def _fine_timer_resolution():
+    """Raise the OS timer resolution to 1 ms for the duration of the block.
+    
+    The default Windows scheduler tick is ~15.6 ms, which adds more jitter
+    to time.sleep() than the randomized delay between combo skills.
+    """
+    if _winmm is None:
+        yield
+        return
+    _winmm.timeBeginPeriod(1)
+    try:
+        yield
+    finally:
+        _winmm.timeEndPeriod(1)
+
+
+def _sleep_until(deadline_ns: int):
+    """Block until time.monotonic_ns() reaches deadline_ns.
+    
+    Sleeps until ~1 ms before the deadline and spins for the remainder,
+    so oversleeping by a scheduler tick cannot push the wake-up late.
+    """
+    while True:
+        remaining = deadline_ns - time.monotonic_ns()
+        if remaining <= 0:
+            return
+        if remaining > 2_000_000:
+            time.sleep((remaining - 1_000_000) / 1e9)
+
+
+def _play_combo(combo_name: str, handlers: List[Callable[[], None]],
+                fire_at: List[int], stop: threading.Event):
+    """Send each skill handler at its scheduled time.monotonic_ns() deadline.
+    
+    Runs on the combo worker thread; it only sends inputs and never touches
+    manager state, which was updated when the combo was scheduled. Skills not
+    yet pressed when `stop` is set are abandoned.
+    """
+    try:
+        with _fine_timer_resolution():
+            for handler, deadline in zip(handlers, fire_at):
+                _sleep_until(deadline)
+                if stop.is_set():
+                    logger.info(f"Combo '{combo_name}' stopped before finishing")
+                    return
+                handler()
+        logger.success(f"✓ Combo '{combo_name}' executed successfully")
+    except Exception as e:
+        logger.error(f"Error executing combo '{combo_name}': {e}")
 
 
 class SkillComboManager:
     """Manages skill combo execution with cooldown tracking."""
     
+    __slots__ = ('hwnd', '_skill_ready_at', '_on_cd_mask', '_cd_expiry',
+                 '_combo_cooldowns', '_single_skill_ready_at',
+                 '_combo_heap', '_heap_combos',
+                 '_decision_plan', '_plan_tables',
+                 '_combo_worker', '_combo_in_flight', '_combo_stop')
+    
     def __init__(self, hwnd: int):
         """Initialize the skill combo manager.
         
@@ -26,75 +129,134 @@ class SkillComboManager:
         """
         self.hwnd = hwnd
         
-        # Cooldown trackers: skill_key -> last_used_time
-        self._skill_cooldowns: Dict[str, float] = {}
+        # All cooldown times below are time.monotonic_ns() integers
+        
+        # Skill cooldown trackers indexed by skill id (skill_combo_config.SKILL_IDS):
+        # when ready again, 0 if never used
+        self._skill_ready_at = array('q')
+        
+        # Bit i is set while skill id i is on cooldown; cleared as entries of the
+        # (ready time, skill id) min-heap expire (see _cooldown_mask)
+        self._on_cd_mask = 0
+        self._cd_expiry: List[Tuple[int, int]] = []
         
-        # Combo cooldown trackers: combo_name -> last_used_time
-        self._combo_cooldowns: Dict[str, float] = {}
+        # Combo cooldown trackers: combo_name -> when ready again
+        self._combo_cooldowns: Dict[str, int] = {}
         
-        # Last combo check time (for logging)
-        self._last_check_time = 0
+        # Single skill global cooldown tracker: when ready again
+        self._single_skill_ready_at = 0
         
-        # Single skill global cooldown tracker
-        self._last_single_skill_use = 0.0
+        # Min-heap of (time a combo can next fire, index) over the enabled
+        # combos list it was built from; None when it must be rebuilt
+        self._combo_heap: Optional[List[Tuple[int, int]]] = None
+        self._heap_combos: Optional[List[Combo]] = None
+        
+        # Pre-sampled attack modes for when single skills and combos are both
+        # ready, tied to the ACTIONABLE_MODE_TABLES they were drawn from
+        self._decision_plan: deque = deque()
+        self._plan_tables: Optional[Dict] = None
+        
+        # Single worker thread playing combos when COMBO_EXECUTION_BACKGROUND
+        # is set (created on first use), the combo it is playing, and the
+        # event that tells it to abandon that combo (see shutdown)
+        self._combo_worker: Optional[ThreadPoolExecutor] = None
+        self._combo_in_flight: Optional[Future] = None
+        self._combo_stop = threading.Event()
         
         # Validate configuration on init
         if not skill_combo_config.validate_configuration():
             logger.error("Skill combo configuration is invalid!")
         
+        self._prepare_handlers()
+        
         logger.info("✓ Skill Combo Manager initialized")
     
-    def is_skill_ready(self, skill: str) -> bool:
+    def _prepare_handlers(self):
+        """Resolve every configured keybind to its input handler up front."""
+        for skill_lower in skill_combo_config.SKILL_COOLDOWN_TABLE:
+            if skill_lower not in _SKILL_HANDLERS:
+                _skill_handler(skill_lower)
+    
+    def refresh_config(self):
+        """Rebuild the prepared combos, weights and handlers after a config edit.
+        
+        Cooldowns already being tracked are kept.
+        """
+        skill_combo_config.refresh_configuration()
+        if not skill_combo_config.validate_configuration():
+            logger.error("Skill combo configuration is invalid!")
+        self._prepare_handlers()
+    
+    def _skill_ready_times(self) -> array:
+        """Get the per-skill ready times, grown to cover every interned skill id."""
+        ready_at = self._skill_ready_at
+        missing = len(skill_combo_config.SKILL_NAMES) - len(ready_at)
+        if missing > 0:
+            ready_at.extend(repeat(0, missing))
+        return ready_at
+    
+    def _skill_ready_time(self, skill: str) -> int:
+        """Get the time.monotonic_ns() a skill keybind is ready again (0 if never used)."""
+        skill_id = skill_combo_config.SKILL_IDS.get(skill.lower())
+        if skill_id is None:
+            return 0
+        return self._skill_ready_times()[skill_id]
+    
+    def _cooldown_mask(self, now: int) -> int:
+        """Get the bitmask of skill ids still on cooldown at `now`."""
+        expiry = self._cd_expiry
+        if expiry and expiry[0][0] <= now:
+            ready_at = self._skill_ready_at
+            mask = self._on_cd_mask
+            while expiry and expiry[0][0] <= now:
+                skill_id = heapq.heappop(expiry)[1]
+                # A skill used again since this entry was pushed has a newer entry
+                if ready_at[skill_id] <= now:
+                    mask &= ~(1 << skill_id)
+            self._on_cd_mask = mask
+        return self._on_cd_mask
+    
+    def is_skill_ready(self, skill: str, now_ns: Optional[int] = None) -> bool:
         """Check if a skill is off cooldown.
         
         Args:
             skill: Skill keybind (e.g., '1', 'alt+2', 'ctrl+5')
+            now_ns: time.monotonic_ns() reading to check against (default: read it)
         
         Returns:
             True if skill is ready to use, False if on cooldown
         """
-        skill_lower = skill.lower()
-        cooldown = skill_combo_config.get_skill_cooldown(skill_lower)
-        
-        if skill_lower not in self._skill_cooldowns:
-            return True  # Never used, ready to use
-        
-        last_used = self._skill_cooldowns[skill_lower]
-        time_since_use = time.time() - last_used
-        
-        return time_since_use >= cooldown
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        # Never-used skills are ready
+        return now_ns >= self._skill_ready_time(skill)
     
-    def is_combo_ready(self, combo: Dict) -> bool:
+    def is_combo_ready(self, combo: Combo) -> bool:
         """Check if a combo set is off cooldown.
         
         Args:
-            combo: Combo set dictionary
+            combo: Combo set
         
         Returns:
             True if combo cooldown is ready, False if on cooldown
         """
-        combo_name = combo.get('name', 'unnamed')
-        combo_cooldown = combo.get('cooldown', 60.0)
-        
-        if combo_name not in self._combo_cooldowns:
-            return True  # Never used, ready to use
-        
-        last_used = self._combo_cooldowns[combo_name]
-        time_since_use = time.time() - last_used
-        
-        return time_since_use >= combo_cooldown
+        # Never-used combos have no entry and are ready
+        return time.monotonic_ns() >= self._combo_cooldowns.get(combo.name, 0)
     
-    def are_all_skills_ready(self, skills: List[str]) -> bool:
+    def are_all_skills_ready(self, skills: Sequence[str], now_ns: Optional[int] = None) -> bool:
         """Check if all skills in a list are off cooldown.
         
         Args:
             skills: List of skill keybinds
+            now_ns: time.monotonic_ns() reading to check against (default: read it)
         
         Returns:
             True if all skills are ready, False if any are on cooldown
         """
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
         for skill in skills:
-            if not self.is_skill_ready(skill):
+            if now_ns < self._skill_ready_time(skill):
                 return False
         return True
     
@@ -107,78 +269,58 @@ class SkillComboManager:
         Returns:
             Remaining cooldown in seconds (0 if ready)
         """
-        skill_lower = skill.lower()
-        cooldown = skill_combo_config.get_skill_cooldown(skill_lower)
-        
-        if skill_lower not in self._skill_cooldowns:
-            return 0.0
-        
-        last_used = self._skill_cooldowns[skill_lower]
-        time_since_use = time.time() - last_used
-        remaining = cooldown - time_since_use
-        
-        return max(0.0, remaining)
+        remaining = self._skill_ready_time(skill) - time.monotonic_ns()
+        return max(0.0, remaining / 1e9)
     
-    def get_combo_cooldown_remaining(self, combo: Dict) -> float:
+    def get_combo_cooldown_remaining(self, combo: Combo) -> float:
         """Get remaining cooldown time for a combo.
         
         Args:
-            combo: Combo set dictionary
+            combo: Combo set
         
         Returns:
             Remaining cooldown in seconds (0 if ready)
         """
-        combo_name = combo.get('name', 'unnamed')
-        combo_cooldown = combo.get('cooldown', 60.0)
-        
-        if combo_name not in self._combo_cooldowns:
-            return 0.0
-        
-        last_used = self._combo_cooldowns[combo_name]
-        time_since_use = time.time() - last_used
-        remaining = combo_cooldown - time_since_use
+        remaining = self._combo_cooldowns.get(combo.name, 0) - time.monotonic_ns()
+        return max(0.0, remaining / 1e9)
+    
+    def _ensure_focus(self):
+        """Focus the game window unless it already is the foreground window.
         
-        return max(0.0, remaining)
+        focus_window() sleeps to let the switch settle, so it is only worth
+        calling when another window actually has focus.
+        """
+        if not is_window_foreground(self.hwnd):
+            focus_window(self.hwnd)
     
-    def execute_skill(self, skill: str) -> bool:
+    def execute_skill(self, skill: str, focus: bool = True,
+                      now_ns: Optional[int] = None) -> bool:
         """Execute a single skill using hardware-level input.
         
         Args:
             skill: Skill keybind (e.g., '1', 'alt+2', 'ctrl+5')
+            focus: Focus the game window first (callers that already did can skip it)
+            now_ns: time.monotonic_ns() reading to start the cooldown from (default: read it)
         
         Returns:
             True if skill was executed, False if failed
         """
         try:
-            # Parse skill into modifier + key
-            modifier, key = skill_combo_config.parse_skill_keybind(skill)
+            skill_lower = skill.lower()
+            handler = _SKILL_HANDLERS.get(skill_lower) or _skill_handler(skill_lower)
             
             # Focus game window
-            focus_window(self.hwnd)
+            if focus:
+                self._ensure_focus()
             
             # Execute the skill with hardware-level input
-            if modifier is None:
-                # Simple key press
-                tap_key(key)
-                logger.debug(f"Skill executed: {key}")
-            elif modifier == 'alt':
-                # Alt + key combination
-                # Hold Alt, press key, release Alt
-                from input_controller import press_key_combination
-                press_key_combination('alt', key)
-                logger.debug(f"Skill executed: Alt+{key}")
-            elif modifier == 'ctrl':
-                # Ctrl + key combination
-                from input_controller import press_key_combination
-                press_key_combination('ctrl', key)
-                logger.debug(f"Skill executed: Ctrl+{key}")
-            else:
-                logger.warning(f"Unknown modifier: {modifier}")
-                return False
+            handler()
+            logger.debug("Skill executed: {}", skill_lower)
             
             # Mark skill as used
-            skill_lower = skill.lower()
-            self._skill_cooldowns[skill_lower] = time.time()
+            if now_ns is None:
+                now_ns = time.monotonic_ns()
+            self._mark_skill_used(skill_lower, now_ns)
             
             return True
             
@@ -186,36 +328,66 @@ class SkillComboManager:
             logger.error(f"Failed to execute skill '{skill}': {e}")
             return False
     
-    def execute_combo(self, combo: Dict) -> bool:
+    def _mark_skill_used(self, skill_lower: str, now_ns: int):
+        """Start a skill's cooldown at now_ns."""
+        cooldown_ns = skill_combo_config.SKILL_COOLDOWN_NS.get(
+            skill_lower, skill_combo_config.DEFAULT_SKILL_COOLDOWN_NS)
+        skill_id = skill_combo_config.intern_skill(skill_lower)
+        ready_at = now_ns + cooldown_ns
+        self._skill_ready_times()[skill_id] = ready_at
+        self._on_cd_mask |= 1 << skill_id
+        heapq.heappush(self._cd_expiry, (ready_at, skill_id))
+        self._combo_heap = None
+    
+    def execute_combo(self, combo: Combo) -> bool:
         """Execute a combo set (all skills in sequence).
         
         Args:
-            combo: Combo set dictionary
+            combo: Combo set
         
         Returns:
-            True if combo was executed successfully, False otherwise
+            True if combo was executed successfully (or, with
+            COMBO_EXECUTION_BACKGROUND, scheduled on the worker thread),
+            False otherwise
         """
-        combo_name = combo.get('name', 'unnamed')
-        skills = combo.get('skills', [])
-        delay = combo.get('delay_between_skills', 0.5)
+        combo_name = combo.name
+        skills = combo.skills
+        delay = combo.delay_between_skills
+        
+        # Keys from two combos must not interleave
+        if self.is_combo_in_flight():
+            logger.debug("Combo '{}' skipped: another combo is still playing", combo_name)
+            return False
         
         logger.info(f"Executing combo: {combo_name} ({len(skills)} skills)")
         
         try:
-            for idx, skill in enumerate(skills):
-                # Execute the skill
-                if not self.execute_skill(skill):
-                    logger.warning(f"Combo '{combo_name}' interrupted at skill {idx+1}/{len(skills)}")
-                    return False
-                
-                # Wait between skills (except after the last one)
-                if idx < len(skills) - 1:
-                    randomized_delay = skill_combo_config.get_randomized_delay(delay)
-                    logger.debug(f"Delay {randomized_delay:.2f}s before next skill")
-                    time.sleep(randomized_delay)
+            # Focus once for the whole combo rather than before every skill
+            self._ensure_focus()
+            
+            if skill_combo_config.COMBO_EXECUTION_BACKGROUND:
+                return self._schedule_combo(combo)
+            
+            with _fine_timer_resolution():
+                skill_start = time.monotonic_ns()
+                for idx, skill in enumerate(skills):
+                    # Execute the skill; its cooldown starts from the same
+                    # clock reading the inter-skill delay is measured from
+                    if not self.execute_skill(skill, focus=False, now_ns=skill_start):
+                        logger.warning(f"Combo '{combo_name}' interrupted at skill {idx+1}/{len(skills)}")
+                        return False
+                    
+                    # Wait between skills (except after the last one); the delay is
+                    # measured from this skill's start so input time doesn't add drift
+                    if idx < len(skills) - 1:
+                        randomized_delay = skill_combo_config.get_randomized_delay(delay)
+                        logger.debug("Delay {:.2f}s before next skill", randomized_delay)
+                        _sleep_until(skill_start + int(randomized_delay * 1e9))
+                        skill_start = time.monotonic_ns()
             
-            # Mark combo as used
-            self._combo_cooldowns[combo_name] = time.time()
+            # Mark combo as used, reusing the last skill's clock reading
+            self._combo_cooldowns[combo_name] = skill_start + combo.cooldown_ns
+            self._combo_heap = None
             
             logger.success(f"✓ Combo '{combo_name}' executed successfully")
             return True
@@ -224,6 +396,50 @@ class SkillComboManager:
             logger.error(f"Error executing combo '{combo_name}': {e}")
             return False
     
+    def _schedule_combo(self, combo: Combo) -> bool:
+        """Hand a combo to the worker thread and return without waiting for it.
+        
+        The randomized delays are drawn up front, so every skill's cooldown and
+        the combo cooldown can be started here from the time the skill is due
+        to fire; the worker then only replays that schedule.
+        """
+        delay = combo.delay_between_skills
+        fire_at = [time.monotonic_ns()]
+        for _ in range(len(combo.skills_lower) - 1):
+            fire_at.append(fire_at[-1] + int(skill_combo_config.get_randomized_delay(delay) * 1e9))
+        
+        handlers = [_SKILL_HANDLERS.get(s) or _skill_handler(s) for s in combo.skills_lower]
+        for skill_lower, at in zip(combo.skills_lower, fire_at):
+            self._mark_skill_used(skill_lower, at)
+        self._combo_cooldowns[combo.name] = fire_at[-1] + combo.cooldown_ns
+        self._combo_heap = None
+        
+        if self._combo_worker is None:
+            self._combo_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix='combo')
+            self._combo_stop = threading.Event()
+        self._combo_in_flight = self._combo_worker.submit(
+            _play_combo, combo.name, handlers, fire_at, self._combo_stop)
+        logger.debug("Combo '{}' scheduled on the worker thread", combo.name)
+        return True
+    
+    def is_combo_in_flight(self) -> bool:
+        """Whether a combo scheduled on the worker thread is still being played."""
+        in_flight = self._combo_in_flight
+        return in_flight is not None and not in_flight.done()
+    
+    def shutdown(self):
+        """Stop the combo worker thread, abandoning any skills it has not pressed yet.
+        
+        A later background combo starts a new worker.
+        """
+        worker = self._combo_worker
+        if worker is None:
+            return
+        self._combo_stop.set()
+        worker.shutdown(wait=False)
+        self._combo_worker = None
+        self._combo_in_flight = None
+    
     def try_execute_combos(self) -> bool:
         """Try to execute any available combo.
         
@@ -237,31 +453,33 @@ class SkillComboManager:
             return False
         
         # Get enabled combos in priority order
-        combos = skill_combo_config.get_enabled_combo_sets()
+        combos = skill_combo_config.get_enabled_combos()
         
         if not combos:
             return False
         
-        # Try each combo in order
+        # Try each combo in order, all checked against one clock reading
+        now = time.monotonic_ns()
+        if self._nothing_ready(combos, now):
+            return False
+        combo_ready_at = self._combo_cooldowns
+        on_cd = self._cooldown_mask(now)
         for combo in combos:
-            combo_name = combo.get('name', 'unnamed')
-            skills = combo.get('skills', [])
+            combo_name = combo.name
             
             # Check if combo cooldown is ready
-            if not self.is_combo_ready(combo):
-                combo_cd_remaining = self.get_combo_cooldown_remaining(combo)
-                logger.debug(f"Combo '{combo_name}' on cooldown: {combo_cd_remaining:.1f}s remaining")
+            # (lazy logging: the diagnostics are only computed if DEBUG is enabled)
+            if now < combo_ready_at.get(combo_name, 0):
+                logger.opt(lazy=True).debug(
+                    "Combo '{}' on cooldown: {:.1f}s remaining",
+                    lambda: combo_name, lambda: (combo_ready_at[combo_name] - now) / 1e9)
                 continue
             
             # Check if all skills are ready
-            if not self.are_all_skills_ready(skills):
-                # Find which skills are on cooldown
-                skills_on_cd = []
-                for skill in skills:
-                    if not self.is_skill_ready(skill):
-                        cd_remaining = self.get_skill_cooldown_remaining(skill)
-                        skills_on_cd.append(f"{skill}({cd_remaining:.1f}s)")
-                logger.debug(f"Combo '{combo_name}' waiting for skills: {', '.join(skills_on_cd)}")
+            if on_cd & combo.mask:
+                logger.opt(lazy=True).debug(
+                    "Combo '{}' waiting for skills: {}",
+                    lambda: combo_name, lambda: self._format_skills_on_cooldown(combo, now))
                 continue
             
             # Combo is ready! Execute it
@@ -271,7 +489,7 @@ class SkillComboManager:
         # No combos were ready
         return False
 
-    def get_ready_combos(self) -> List[Dict]:
+    def get_ready_combos(self) -> List[Combo]:
         """Return a list of enabled combos that are ready now.
 
         A combo is considered ready if:
@@ -279,20 +497,78 @@ class SkillComboManager:
         - All of its skills are currently off cooldown.
 
         Returns:
-            A list of combo dicts that are ready to execute.
+            A list of combos that are ready to execute.
         """
         if not skill_combo_config.SKILL_COMBO_ENABLED:
             return []
 
-        combos = skill_combo_config.get_enabled_combo_sets()
-        ready: List[Dict] = []
+        now = time.monotonic_ns()
+        combos = skill_combo_config.get_enabled_combos()
+        if self._nothing_ready(combos, now):
+            return []
+        on_cd = self._cooldown_mask(now)
+        return [combo for combo in combos if self._is_fully_ready(combo, now, on_cd)]
+
+    def _combo_ready_heap(self, combos: List[Combo]) -> List[Tuple[int, int]]:
+        """Get the heap of (next ready time, index) for `combos`.
+
+        A combo's next ready time is the latest of its own cooldown and its
+        skills' cooldowns. The heap is rebuilt lazily after any skill is used,
+        cooldowns are reset, or the enabled combos change.
+        """
+        heap = self._combo_heap
+        if heap is None or combos is not self._heap_combos:
+            combo_ready_at = self._combo_cooldowns
+            skill_ready_at = self._skill_ready_times()
+            heap = [
+                (max(combo_ready_at.get(combo.name, 0),
+                     max((skill_ready_at[i] for i in combo.skill_ids), default=0)),
+                 idx)
+                for idx, combo in enumerate(combos)
+            ]
+            heapq.heapify(heap)
+            self._combo_heap = heap
+            self._heap_combos = combos
+        return heap
+
+    def _nothing_ready(self, combos: List[Combo], now: int) -> bool:
+        """True if no combo in `combos` can be ready at `now` (one compare)."""
+        heap = self._combo_ready_heap(combos)
+        return not heap or now < heap[0][0]
+
+    def _is_fully_ready(self, combo: Combo, now: int, on_cd: int) -> bool:
+        """True if the combo and all of its skills are off cooldown at `now`.
+
+        `on_cd` is the skill cooldown mask at `now` (from _cooldown_mask).
+        """
+        if now < self._combo_cooldowns.get(combo.name, 0):
+            return False
+        return not on_cd & combo.mask
+
+    def _pick_ready_combo(self) -> Optional[Combo]:
+        """Pick a uniformly random ready combo without building a list.
+
+        Uses single-pass reservoir sampling over the enabled combos.
+
+        Returns:
+            A ready combo, or None if none are ready.
+        """
+        if not skill_combo_config.SKILL_COMBO_ENABLED:
+            return None
+
+        now = time.monotonic_ns()
+        combos = skill_combo_config.get_enabled_combos()
+        if self._nothing_ready(combos, now):
+            return None
+        on_cd = self._cooldown_mask(now)
+        chosen = None
+        seen = 0
         for combo in combos:
-            if not self.is_combo_ready(combo):
-                continue
-            skills = combo.get('skills', [])
-            if self.are_all_skills_ready(skills):
-                ready.append(combo)
-        return ready
+            if self._is_fully_ready(combo, now, on_cd):
+                seen += 1
+                if random.random() * seen < 1.0:
+                    chosen = combo
+        return chosen
 
     def try_execute_random_combo(self) -> bool:
         """Pick a random ready combo and execute it.
@@ -300,14 +576,23 @@ class SkillComboManager:
         Returns:
             True if a combo was executed, False otherwise.
         """
-        ready = self.get_ready_combos()
-        if not ready:
+        combo = self._pick_ready_combo()
+        if combo is None:
             return False
 
-        combo = random.choice(ready)
-        logger.info(f"⚡ Random combo selected: {combo.get('name','unnamed')}")
+        logger.info(f"⚡ Random combo selected: {combo.name}")
         return self.execute_combo(combo)
     
+    def _format_skills_on_cooldown(self, combo: Combo, now: int) -> str:
+        """Format the combo's skills still on cooldown as 'skill(1.2s), ...'."""
+        skill_ready_at = self._skill_ready_times()
+        skills_on_cd = []
+        for skill, skill_id in zip(combo.skills, combo.skill_ids):
+            cd = (skill_ready_at[skill_id] - now) / 1e9
+            if cd > 0:
+                skills_on_cd.append(f"{skill}({cd:.1f}s)")
+        return ', '.join(skills_on_cd)
+    
     def get_status_summary(self) -> str:
         """Get a summary of all combo and skill cooldown statuses.
         
@@ -317,24 +602,22 @@ class SkillComboManager:
         lines = []
         lines.append("=== Skill Combo Status ===")
         
-        combos = skill_combo_config.get_enabled_combo_sets()
+        # One clock read for the whole summary; cooldowns are read directly
+        # from the trackers instead of going through the per-skill helpers
+        now = time.monotonic_ns()
+        combos = skill_combo_config.get_enabled_combos()
         for combo in combos:
-            combo_name = combo.get('name', 'unnamed')
-            combo_cd = self.get_combo_cooldown_remaining(combo)
+            combo_name = combo.name
+            combo_cd = (self._combo_cooldowns.get(combo_name, 0) - now) / 1e9
             
             if combo_cd > 0:
                 status = f"⏱ Cooldown: {combo_cd:.1f}s"
             else:
-                skills = combo.get('skills', [])
-                if self.are_all_skills_ready(skills):
-                    status = "✅ READY"
+                skills_on_cd = self._format_skills_on_cooldown(combo, now)
+                if skills_on_cd:
+                    status = f"⏳ Waiting: {skills_on_cd}"
                 else:
-                    skills_on_cd = []
-                    for skill in skills:
-                        if not self.is_skill_ready(skill):
-                            cd = self.get_skill_cooldown_remaining(skill)
-                            skills_on_cd.append(f"{skill}({cd:.1f}s)")
-                    status = f"⏳ Waiting: {', '.join(skills_on_cd)}"
+                    status = "✅ READY"
             
             lines.append(f"  {combo_name}: {status}")
         
@@ -342,9 +625,12 @@ class SkillComboManager:
     
     def reset_cooldowns(self):
         """Reset all cooldowns (for testing/debugging)."""
-        self._skill_cooldowns.clear()
+        self._skill_ready_at = array('q')
+        self._on_cd_mask = 0
+        self._cd_expiry.clear()
         self._combo_cooldowns.clear()
-        self._last_single_skill_use = 0.0
+        self._single_skill_ready_at = 0
+        self._combo_heap = None
         logger.info("All cooldowns reset")
 
     # ------------------------------
@@ -357,18 +643,41 @@ class SkillComboManager:
         Respects SINGLE_SKILL_POOL (or all skills if empty) and per-skill cooldowns.
         Does not consider the global single skill cooldown (GCD).
         """
-        pool = skill_combo_config.SINGLE_SKILL_POOL or list(skill_combo_config.SKILL_COOLDOWNS.keys())
-        return [s for s in pool if self.is_skill_ready(s)]
+        now = time.monotonic_ns()
+        skill_ready_at = self._skill_ready_times()
+        return [skill_lower for skill_lower, skill_id in zip(skill_combo_config.SINGLE_SKILL_POOL_LOWER,
+                                                             skill_combo_config.SINGLE_SKILL_POOL_IDS)
+                if skill_ready_at[skill_id] <= now]
 
     def has_available_single_skill(self) -> bool:
         """True if GCD is ready and at least one pool skill is off cooldown."""
-        if not self.is_single_skill_ready():
+        now = time.monotonic_ns()
+        if now < self._single_skill_ready_at:
             return False
-        return len(self.available_single_skills()) > 0
+        pool_mask = skill_combo_config.SINGLE_SKILL_POOL_MASK
+        return pool_mask & ~self._cooldown_mask(now) != 0
+
+    def any_skill_ready_mask(self, now_ns: Optional[int] = None) -> int:
+        """Bitmask of known skill ids that are off cooldown (0 if none are).
+        
+        Args:
+            now_ns: time.monotonic_ns() reading to check against (default: read it)
+        """
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        known = (1 << len(skill_combo_config.SKILL_NAMES)) - 1
+        return known & ~self._cooldown_mask(now_ns)
 
     def has_ready_combo(self) -> bool:
-        """True if at least one enabled combo is fully ready now."""
-        return len(self.get_ready_combos()) > 0
+        """True if at least one enabled combo is fully ready now.
+        
+        Always False while a background combo is still playing.
+        """
+        if not skill_combo_config.SKILL_COMBO_ENABLED or self.is_combo_in_flight():
+            return False
+        # The earliest next-ready time in the heap is exact, so a due top
+        # means that combo is ready
+        return not self._nothing_ready(skill_combo_config.get_enabled_combos(), time.monotonic_ns())
     
     def choose_attack_mode(self) -> str:
         """Choose attack mode based on stealth configuration.
@@ -379,58 +688,48 @@ class SkillComboManager:
         if not skill_combo_config.STEALTH_ATTACK_MODE_ENABLED:
             return 'combo_set'  # Default to combo execution
         
-        weights = skill_combo_config.ATTACK_MODE_WEIGHTS
-        modes = list(weights.keys())
-        probabilities = list(weights.values())
-        
-        # Normalize probabilities
-        total = sum(probabilities)
-        if total != 1.0:
-            probabilities = [p / total for p in probabilities]
-        
-        chosen = random.choices(modes, weights=probabilities, k=1)[0]
-        return chosen
+        # Weights are pre-normalized into a cumulative table at config load
+        cumweights = skill_combo_config.ATTACK_MODE_CUMWEIGHTS
+        return skill_combo_config.ATTACK_MODE_MODES[bisect_right(cumweights, random.random())]
 
     def choose_actionable_mode(self, has_health: bool) -> str:
         """Choose an attack mode using weights but ensure it's actionable.
 
-        If health gating is enabled and has_health is False, returns 'standard_attack'.
-        Otherwise filters choices by readiness (available skills/ready combos). If no
+        If health gating is enabled and has_health is False, or a background combo is
+        still playing, returns 'standard_attack'. Otherwise filters choices by readiness (available skills/ready combos). If no
         weighted choice is actionable, falls back in this order: single_skill -> combo_set -> standard_attack,
         preferring modes that are actually executable right now.
         """
         if skill_combo_config.REQUIRE_MOB_HEALTH_FOR_SKILLS and not has_health:
             return 'standard_attack'
+        if self.is_combo_in_flight():
+            return 'standard_attack'
+
+        # Fast path: with every skill on cooldown neither a single skill nor a
+        # combo can run, so skip the readiness scans and the weighted roll
+        if not self.any_skill_ready_mask():
+            return 'standard_attack'
 
         # Gather readiness
         single_ready = self.has_available_single_skill()
         combo_ready = self.has_ready_combo()
 
-        # Build weighted candidate list conditioned on readiness
-        weights = skill_combo_config.ATTACK_MODE_WEIGHTS.copy()
-        candidates: List[Tuple[str, float]] = []
-        for mode, w in weights.items():
-            if mode == 'single_skill' and not single_ready:
-                continue
-            if mode == 'combo_set' and not combo_ready:
-                continue
-            candidates.append((mode, max(0.0, float(w))))
-
-        if candidates:
-            modes, probs = zip(*candidates)
-            total = sum(probs)
-            if total <= 0:
-                modes = ('single_skill', 'combo_set', 'standard_attack')
-                probs = (1, 1, 1)
-            choice = random.choices(modes, weights=probs, k=1)[0]
-            return choice
-
-        # No weighted candidate is ready; pick best available fallback
-        if single_ready:
-            return 'single_skill'
-        if combo_ready:
-            return 'combo_set'
-        return 'standard_attack'
+        # The weighted candidates (and fallback) for each readiness state are
+        # precomputed by skill_combo_config, so this is a table lookup
+        tables = skill_combo_config.ACTIONABLE_MODE_TABLES
+        modes, cumweights = tables[(single_ready, combo_ready)]
+        if not (single_ready and combo_ready):
+            return modes[bisect_right(cumweights, random.random())]
+        
+        # Everything is actionable, so the distribution is fixed until the
+        # config changes; draw decisions in batches and hand them out one by one
+        plan = self._decision_plan
+        if self._plan_tables is not tables:
+            plan.clear()
+            self._plan_tables = tables
+        if not plan:
+            plan.extend(random.choices(modes, cum_weights=cumweights, k=_DECISION_PLAN_SIZE))
+        return plan.popleft()
     
     def is_single_skill_ready(self) -> bool:
         """Check if single skill global cooldown is ready.
@@ -438,9 +737,7 @@ class SkillComboManager:
         Returns:
             True if can use single skill, False if on GCD
         """
-        gcd = skill_combo_config.SINGLE_SKILL_GLOBAL_COOLDOWN
-        time_since_use = time.time() - self._last_single_skill_use
-        return time_since_use >= gcd
+        return time.monotonic_ns() >= self._single_skill_ready_at
     
     def execute_single_skill(self) -> bool:
         """Execute a single random skill from the pool.
@@ -448,31 +745,37 @@ class SkillComboManager:
         Returns:
             True if skill was executed, False otherwise
         """
-        if not self.is_single_skill_ready():
+        now = time.monotonic_ns()
+        if now < self._single_skill_ready_at:
             logger.debug("Single skill on global cooldown")
             return False
+        if self.is_combo_in_flight():
+            logger.debug("Single skill skipped: a combo is still playing")
+            return False
         
-        # Get skill pool
-        skill_pool = skill_combo_config.SINGLE_SKILL_POOL
-        if not skill_pool:
-            # If pool is empty, use all configured skills
-            skill_pool = list(skill_combo_config.SKILL_COOLDOWNS.keys())
-        
-        # Filter to only skills that are off cooldown
-        available_skills = [s for s in skill_pool if self.is_skill_ready(s)]
-        
-        if not available_skills:
+        # Pick a random off-cooldown skill from the precomputed pool in one
+        # pass (reservoir sampling), using the same clock reading as the GCD check
+        skill_ready_at = self._skill_ready_times()
+        skill_id = -1
+        seen = 0
+        for i in skill_combo_config.SINGLE_SKILL_POOL_IDS:
+            if skill_ready_at[i] <= now:
+                seen += 1
+                if random.random() * seen < 1.0:
+                    skill_id = i
+        
+        if skill_id < 0:
             logger.debug("No skills available in single skill pool")
             return False
-        
-        # Pick a random skill
-        skill = random.choice(available_skills)
+        skill = skill_combo_config.SKILL_NAMES[skill_id]
         
         logger.info(f"⚡ Single skill attack: {skill}")
         
-        # Execute the skill
-        if self.execute_skill(skill):
-            self._last_single_skill_use = time.time()
+        # Execute the skill; its cooldown and the GCD both start from the
+        # clock reading taken for the readiness checks above
+        if self.execute_skill(skill, now_ns=now):
+            gcd = skill_combo_config.SINGLE_SKILL_GLOBAL_COOLDOWN
+            self._single_skill_ready_at = now + int(gcd * 1e9)
             return True
         
         return False
@@ -9,7 +9,42 @@ CryEngine has AGGRESSIVE anti-cheat that detects:
 
 This config makes the bot look like a slow, cautious human player.
 """
+import os
 import random
+import threading
+from math import log as _log, log1p as _log1p
+from bisect import bisect_right
+
+import numpy as np
+from loguru import logger
+
+def _seed_from_env():
+    """Read AION_SEED: a positive integer seed, or None (unseeded) when unset or 0.
+
+    Bad values only log a warning; a debugging variable must not stop the bot.
+    """
+    raw = os.environ.get('AION_SEED', '').strip()
+    if not raw:
+        return None
+    try:
+        seed = int(raw)
+    except ValueError:
+        seed = -1
+    if seed < 0:
+        logger.warning(f"Ignoring AION_SEED={raw!r} (expected a non-negative integer); using an unseeded RNG")
+        return None
+    return seed or None
+
+# Set AION_SEED to a positive integer to make every draw in this module
+# reproducible (e.g. for testing); the global `random` module is left alone.
+_SEED = _seed_from_env()
+_py_rng = random.Random(_SEED)
+
+# Bound once so the hot helpers below skip the attribute lookup.
+# Uniform draws are written as lo + (hi - lo) * _random(), which skips the
+# Python-level random.uniform() call.
+_random = _py_rng.random
+_choice = _py_rng.choice
 
 # ============================================================================
 # CRITICAL: ULTRA-SLOW TIMING TO AVOID CRYENGINE DETECTION
@@ -167,125 +202,229 @@ MOVEMENT_PATTERN_CHANGE_CHANCE = 0.25  # 25% chance per action
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Samples drawn per refill of a _DelayBuffer
+_DELAY_BUFFER_SIZE = 4096
+
+_rng = np.random.default_rng(_SEED)
+
+
+class _DelayBuffer:
+    """Serves uniform samples between two settings, drawn from numpy in blocks.
+
+    The settings are looked up by name when the buffer refills, so edits to
+    them take effect from the next block. Safe to share between threads.
+    The first block is drawn on creation so the first call does not pay for it.
+    """
+    __slots__ = ('_names', '_samples', '_idx', '_lock')
+
+    def __init__(self, *names):
+        self._names = names
+        self._samples = self._draw()
+        self._idx = 0
+        self._lock = threading.Lock()
+
+    def next(self):
+        with self._lock:
+            idx = self._idx
+            samples = self._samples
+            if idx >= len(samples):
+                samples = self._samples = self._draw()
+                idx = 0
+            self._idx = idx + 1
+            return samples[idx]
+
+    def _draw(self):
+        g = globals()
+        min_name, max_name = self._names
+        # numpy rejects low > high (random.uniform did not), and the settings
+        # dialog can save a MIN above its MAX
+        lo, hi = sorted((g[min_name], g[max_name]))
+        return _rng.uniform(lo, hi, _DELAY_BUFFER_SIZE).tolist()
+
+
+class _JitterBuffer(_DelayBuffer):
+    """Serves (dx, dy) pixel offsets within +/- an X and a Y jitter setting."""
+    __slots__ = ()
+
+    def _draw(self):
+        g = globals()
+        x_name, y_name = self._names
+        jx, jy = g[x_name], g[y_name]
+        offsets = _rng.integers((-jx, -jy), (jx + 1, jy + 1), (_DELAY_BUFFER_SIZE, 2))
+        return [tuple(pair) for pair in offsets.tolist()]
+
+
+class _BernoulliCountdown:
+    """Answers a per-call 'True with probability p' check by counting down.
+
+    Instead of drawing a random number on every call, the number of False
+    answers before the next True is drawn from a geometric distribution, so
+    most calls are a single decrement. The probability setting is looked up
+    by name when the next gap is drawn, so edits take effect after the next True.
+    """
+    __slots__ = ('_name', '_countdown')
+
+    def __init__(self, name):
+        self._name = name
+        self._countdown = self._gap()
+
+    def next(self):
+        countdown = self._countdown
+        if countdown > 0:
+            self._countdown = countdown - 1
+            return False
+        self._countdown = self._gap()
+        # A negative countdown means the probability was <= 0 (never True)
+        return countdown == 0
+
+    def _gap(self):
+        p = globals()[self._name]
+        if p <= 0:
+            return -1
+        if p >= 1:
+            return 0
+        # Failures before the first success, by inverting the geometric CDF
+        return int(_log(1.0 - _random()) / _log1p(-p))
+
+
+# Buffers for the delays drawn on every click and key press
+_action_buf = _DelayBuffer('ACTION_COOLDOWN_MIN', 'ACTION_COOLDOWN_MAX')
+_post_click_buf = _DelayBuffer('POST_CLICK_DELAY_MIN', 'POST_CLICK_DELAY_MAX')
+_mouse_move_buf = _DelayBuffer('MOUSE_MOVE_DURATION_MIN', 'MOUSE_MOVE_DURATION_MAX')
+_key_down_buf = _DelayBuffer('KEY_TAP_DOWN_MIN', 'KEY_TAP_DOWN_MAX')
+_key_interval_buf = _DelayBuffer('KEY_TAP_INTERVAL_MIN', 'KEY_TAP_INTERVAL_MAX')
+_double_click_buf = _DelayBuffer('DOUBLE_CLICK_INTERVAL_MIN', 'DOUBLE_CLICK_INTERVAL_MAX')
+_button_down_buf = _DelayBuffer('MOUSE_BUTTON_DOWN_MIN', 'MOUSE_BUTTON_DOWN_MAX')
+_pre_click_buf = _DelayBuffer('PRE_CLICK_PAUSE_MIN', 'PRE_CLICK_PAUSE_MAX')
+_click_key_buf = _DelayBuffer('CLICK_KEY_DELAY_MIN', 'CLICK_KEY_DELAY_MAX')
+_mouse_jitter_buf = _JitterBuffer('MOUSE_JITTER_X', 'MOUSE_JITTER_Y')
+_micro_jitter_buf = _JitterBuffer('MICRO_JITTER_BEFORE_CLICK', 'MICRO_JITTER_BEFORE_CLICK')
+_idle_countdown = _BernoulliCountdown('IDLE_PROBABILITY')
+_pattern_change_countdown = _BernoulliCountdown('MOVEMENT_PATTERN_CHANGE_CHANCE')
+
 def get_action_delay():
     """Get random delay between actions (seconds)."""
-    return random.uniform(ACTION_COOLDOWN_MIN, ACTION_COOLDOWN_MAX)
+    return _action_buf.next()
 
 def get_post_click_delay():
     """Get random delay after clicking (seconds)."""
-    return random.uniform(POST_CLICK_DELAY_MIN, POST_CLICK_DELAY_MAX)
+    return _post_click_buf.next()
 
 def get_post_movement_delay():
     """Get random delay after movement (seconds)."""
-    return random.uniform(POST_MOVEMENT_DELAY_MIN, POST_MOVEMENT_DELAY_MAX)
+    return POST_MOVEMENT_DELAY_MIN + (POST_MOVEMENT_DELAY_MAX - POST_MOVEMENT_DELAY_MIN) * _random()
 
 def get_mouse_move_duration():
     """Get random mouse movement duration (seconds)."""
-    return random.uniform(MOUSE_MOVE_DURATION_MIN, MOUSE_MOVE_DURATION_MAX)
+    return _mouse_move_buf.next()
 
 def get_mouse_jitter():
     """Get random mouse position jitter (dx, dy in pixels)."""
-    dx = random.randint(-MOUSE_JITTER_X, MOUSE_JITTER_X)
-    dy = random.randint(-MOUSE_JITTER_Y, MOUSE_JITTER_Y)
-    return dx, dy
+    return _mouse_jitter_buf.next()
 
 def get_micro_jitter():
     """Get tiny mouse jitter for pre-click micro-movement (dx, dy in px)."""
-    j = MICRO_JITTER_BEFORE_CLICK
-    return random.randint(-j, j), random.randint(-j, j)
+    return _micro_jitter_buf.next()
 
 def get_mob_click_offset(mob_height):
     """Get Y offset for clicking on mob (pixels from top of mob box)."""
-    ratio = random.uniform(MOB_CLICK_Y_MIN, MOB_CLICK_Y_MAX)
+    ratio = MOB_CLICK_Y_MIN + (MOB_CLICK_Y_MAX - MOB_CLICK_Y_MIN) * _random()
     return int(mob_height * ratio)
 
 def should_idle():
     """Check if bot should enter idle state (returns bool)."""
-    return random.random() < IDLE_PROBABILITY
+    return _idle_countdown.next()
 
 def get_idle_duration():
     """Get random idle duration (seconds)."""
-    return random.uniform(IDLE_DURATION_MIN, IDLE_DURATION_MAX)
+    return IDLE_DURATION_MIN + (IDLE_DURATION_MAX - IDLE_DURATION_MIN) * _random()
 
 def get_key_hold_duration():
     """Get random key hold duration with variation (seconds)."""
-    base = random.uniform(KEY_HOLD_DURATION_MIN, KEY_HOLD_DURATION_MAX)
-    variation = base * KEY_HOLD_VARIATION * random.uniform(-1, 1)
+    base = KEY_HOLD_DURATION_MIN + (KEY_HOLD_DURATION_MAX - KEY_HOLD_DURATION_MIN) * _random()
+    variation = base * KEY_HOLD_VARIATION * (2.0 * _random() - 1.0)
     return max(0.1, base + variation)
 
 def get_key_tap_down_time():
     """Randomized down-time for a tap key (seconds)."""
-    return random.uniform(KEY_TAP_DOWN_MIN, KEY_TAP_DOWN_MAX)
+    return _key_down_buf.next()
 
 def get_key_tap_interval():
     """Randomized interval between repeated taps (seconds)."""
-    return random.uniform(KEY_TAP_INTERVAL_MIN, KEY_TAP_INTERVAL_MAX)
+    return _key_interval_buf.next()
 
 def get_startup_delay():
     """Get random startup delay (seconds)."""
-    return random.uniform(STARTUP_DELAY_MIN, STARTUP_DELAY_MAX)
+    return STARTUP_DELAY_MIN + (STARTUP_DELAY_MAX - STARTUP_DELAY_MIN) * _random()
 
 def get_warmup_delay():
     """Get extra delay for warmup actions (seconds)."""
-    return random.uniform(WARMUP_EXTRA_DELAY_MIN, WARMUP_EXTRA_DELAY_MAX)
+    return WARMUP_EXTRA_DELAY_MIN + (WARMUP_EXTRA_DELAY_MAX - WARMUP_EXTRA_DELAY_MIN) * _random()
 
 def get_turn_70_degrees_duration():
     """Get duration to turn approximately 70 degrees (seconds)."""
-    return random.uniform(TURN_70_DEGREES_MIN, TURN_70_DEGREES_MAX)
+    return TURN_70_DEGREES_MIN + (TURN_70_DEGREES_MAX - TURN_70_DEGREES_MIN) * _random()
 
 def get_mouse_drag_duration():
     """Get random mouse drag duration (seconds)."""
-    return random.uniform(MOUSE_DRAG_MIN_DURATION, MOUSE_DRAG_MAX_DURATION)
+    return MOUSE_DRAG_MIN_DURATION + (MOUSE_DRAG_MAX_DURATION - MOUSE_DRAG_MIN_DURATION) * _random()
 
 def get_movement_pattern():
     """Get random movement pattern."""
-    return random.choice(MOVEMENT_PATTERNS)
+    return _choice(MOVEMENT_PATTERNS)
 
 def get_movement_pattern_duration():
     """Get duration for movement pattern (seconds)."""
-    return random.uniform(MOVEMENT_PATTERN_MIN, MOVEMENT_PATTERN_MAX)
+    return MOVEMENT_PATTERN_MIN + (MOVEMENT_PATTERN_MAX - MOVEMENT_PATTERN_MIN) * _random()
 
 def should_change_movement_pattern():
     """Check if movement pattern should change."""
-    return random.random() < MOVEMENT_PATTERN_CHANGE_CHANCE
+    return _pattern_change_countdown.next()
 
 def get_double_click_interval():
     """Interval between first and second click (seconds)."""
-    return random.uniform(DOUBLE_CLICK_INTERVAL_MIN, DOUBLE_CLICK_INTERVAL_MAX)
+    return _double_click_buf.next()
 
 def get_mouse_button_down_time():
     """How long to keep mouse button held down (seconds)."""
-    return random.uniform(MOUSE_BUTTON_DOWN_MIN, MOUSE_BUTTON_DOWN_MAX)
+    return _button_down_buf.next()
 
 def get_pre_click_pause():
     """Short pause before a click to mimic human hesitation (seconds)."""
-    return random.uniform(PRE_CLICK_PAUSE_MIN, PRE_CLICK_PAUSE_MAX)
+    return _pre_click_buf.next()
 
 def get_click_then_key_delay():
     """Delay between click and primary attack key press (seconds)."""
-    return random.uniform(CLICK_KEY_DELAY_MIN, CLICK_KEY_DELAY_MAX)
+    return _click_key_buf.next()
+
+_STRATEGY_NAMES = ('two_single', 'click_then_key', 'key_then_click', 'right_click')
+
+def _rebuild_strategy_cdf():
+    """Rebuild the cumulative probabilities of _STRATEGY_NAMES from the STRATEGY_WEIGHT_* values.
+
+    Call again after changing the weights at runtime.
+    """
+    global _STRATEGY_CDF
+    weights = [max(0.0, w) for w in (STRATEGY_WEIGHT_TWO_SINGLE, STRATEGY_WEIGHT_CLICK_THEN_KEY,
+                                     STRATEGY_WEIGHT_KEY_THEN_CLICK, STRATEGY_WEIGHT_RIGHT_CLICK)]
+    total = sum(weights)
+    # fallback to sensible defaults if all zero
+    if total <= 0:
+        weights, total = [0.0, 0.8, 0.1, 0.1], 1.0
+    cdf = []
+    running = 0.0
+    for w in weights:
+        running += w
+        cdf.append(running / total)
+    # Rounding must not leave a gap below 1.0 that bisect could land past
+    cdf[-1] = 1.0
+    _STRATEGY_CDF = tuple(cdf)
+
+_rebuild_strategy_cdf()
 
 def choose_attack_click_strategy():
     """Choose which strategy to use for a standard 'attack' click.
 
     Returns one of: 'two_single', 'click_then_key', 'key_then_click', 'right_click'
     """
-    w_two = max(0.0, STRATEGY_WEIGHT_TWO_SINGLE)
-    w_ck = max(0.0, STRATEGY_WEIGHT_CLICK_THEN_KEY)
-    w_ktc = max(0.0, STRATEGY_WEIGHT_KEY_THEN_CLICK)
-    w_right = max(0.0, STRATEGY_WEIGHT_RIGHT_CLICK)
-    total = w_two + w_ck + w_ktc + w_right
-    # fallback to sensible defaults if all zero
-    if total <= 0:
-        w_two, w_ck, w_ktc, w_right = 0.0, 0.8, 0.1, 0.1
-        total = 1.0
-    r = random.random() * total
-    if r < w_two:
-        return 'two_single'
-    r -= w_two
-    if r < w_ck:
-        return 'click_then_key'
-    r -= w_ck
-    if r < w_ktc:
-        return 'key_then_click'
-    return 'right_click'
+    return _STRATEGY_NAMES[bisect_right(_STRATEGY_CDF, _random())]
@@ -3,8 +3,55 @@
 This script demonstrates and tests the skill combo macro system.
 """
 import time
+import random
+from contextlib import contextmanager
+from unittest import mock
+import skill_combo_manager
 from skill_combo_manager import SkillComboManager
 import skill_combo_config
+import stealth_config
+
+
+def _check(failures, label, ok):
+    """Print a ✓/✗ line for one check and remember the failures."""
+    print(f"   {'✓' if ok else '✗'} {label}")
+    if not ok:
+        failures.append(label)
+
+
+class _FakeClock:
+    """Stands in for time.monotonic_ns() so cooldowns can be stepped through."""
+    
+    def __init__(self):
+        self.now = 1_000_000_000_000
+    
+    def __call__(self) -> int:
+        return self.now
+    
+    def advance(self, seconds: float):
+        self.now += int(seconds * 1e9)
+    
+    def sleep_until(self, deadline_ns: int):
+        self.now = max(self.now, deadline_ns)
+
+
+@contextmanager
+def _simulated_inputs(clock: _FakeClock):
+    """Run the manager on the fake clock with every key press replaced by a no-op."""
+    no_ops = {skill.lower(): (lambda: None) for skill in skill_combo_config.SKILL_COOLDOWNS}
+    with mock.patch('time.monotonic_ns', clock), \
+            mock.patch.dict(skill_combo_manager._SKILL_HANDLERS, no_ops), \
+            mock.patch.object(skill_combo_manager, 'is_window_foreground', lambda hwnd: True), \
+            mock.patch.object(skill_combo_manager, '_sleep_until', clock.sleep_until):
+        yield
+
+
+def _expected_ready_combos(manager):
+    """Names of the ready combos, worked out from the per-skill and per-combo
+    remaining cooldowns rather than the manager's mask and heap."""
+    return [combo.name for combo in skill_combo_config.get_enabled_combos()
+            if manager.get_combo_cooldown_remaining(combo) <= 0
+            and all(manager.get_skill_cooldown_remaining(s) <= 0 for s in combo.skills)]
 
 
 def test_skill_combo_system():
@@ -100,14 +147,14 @@ def test_skill_combo_system():
         print(f"   - Skill '{test_skill}' ready: {is_ready} (should be True - never used)")
         
         # Get first enabled combo
-        combos = skill_combo_config.get_enabled_combo_sets()
+        combos = skill_combo_config.get_enabled_combos()
         if combos:
             combo = combos[0]
-            combo_name = combo.get('name', 'unnamed')
+            combo_name = combo.name
             is_ready = manager.is_combo_ready(combo)
             print(f"   - Combo '{combo_name}' ready: {is_ready} (should be True - never used)")
             
-            skills = combo.get('skills', [])
+            skills = combo.skills
             all_ready = manager.are_all_skills_ready(skills)
             print(f"   - All skills in combo ready: {all_ready} (should be True)")
         
@@ -135,5 +182,158 @@ def test_skill_combo_system():
     print("=" * 70)
 
 
+
+def test_cooldown_tracking():
+    """Test the skill cooldown mask and combo ready heap against a fake clock."""
+    print("\nCOOLDOWN TRACKING TEST")
+    failures = []
+    clock = _FakeClock()
+    
+    with _simulated_inputs(clock):
+        # A skill used again before its first cooldown ends must stay on
+        # cooldown when the first (stale) expiry entry comes due
+        manager = SkillComboManager(hwnd=0)
+        skill = '1'
+        cooldown = skill_combo_config.get_skill_cooldown(skill)
+        manager.execute_skill(skill, focus=False)
+        clock.advance(cooldown / 2)
+        manager.execute_skill(skill, focus=False)
+        clock.advance(cooldown / 2 + 0.1)
+        holder = next(c for c in skill_combo_config.get_enabled_combos() if skill in c.skills)
+        _check(failures, "Reused skill stays on cooldown past its first expiry",
+               not manager.is_skill_ready(skill)
+               and holder.name not in [c.name for c in manager.get_ready_combos()])
+        clock.advance(cooldown / 2)
+        _check(failures, "Reused skill is ready after its second cooldown",
+               manager.is_skill_ready(skill)
+               and holder.name in [c.name for c in manager.get_ready_combos()])
+        
+        # reset_cooldowns clears the mask and heap, and tracking works afterwards
+        combo = skill_combo_config.get_enabled_combos()[0]
+        manager.execute_combo(combo)
+        _check(failures, "Executed combo is not ready",
+               combo.name not in [c.name for c in manager.get_ready_combos()])
+        manager.reset_cooldowns()
+        _check(failures, "Every skill is ready after reset_cooldowns",
+               all(manager.is_skill_ready(s) for s in skill_combo_config.SKILL_COOLDOWNS))
+        _check(failures, "Combo is ready after reset_cooldowns",
+               combo.name in [c.name for c in manager.get_ready_combos()])
+        manager.execute_combo(combo)
+        _check(failures, "Combo used after reset_cooldowns is on cooldown again",
+               not manager.is_combo_ready(combo))
+        
+        # refresh_configuration swapping the combo list must not reuse the
+        # ready heap built for the old list
+        original_combos = skill_combo_config.COMBO_SETS
+        manager = SkillComboManager(hwnd=0)
+        try:
+            used = set()
+            for c in skill_combo_config.get_enabled_combos():
+                for s in c.skills:
+                    manager.execute_skill(s, focus=False)
+                    used.add(s.lower())
+            _check(failures, "No combo is ready once every combo skill was used",
+                   not manager.has_ready_combo())
+            unused = next(s for s in skill_combo_config.SKILL_COOLDOWNS if s.lower() not in used)
+            skill_combo_config.COMBO_SETS = [
+                {'name': 'Swap Test', 'skills': [unused], 'cooldown': 5.0,
+                 'delay_between_skills': 0.5, 'enabled': True},
+            ]
+            skill_combo_config.refresh_configuration()
+            _check(failures, "Swapped-in combo is ready after refresh_configuration",
+                   manager.has_ready_combo()
+                   and [c.name for c in manager.get_ready_combos()] == ['Swap Test'])
+        finally:
+            skill_combo_config.COMBO_SETS = original_combos
+            skill_combo_config.refresh_configuration()
+        
+        # Random use: has_ready_combo, get_ready_combos and is_skill_ready must
+        # agree with readiness worked out from the remaining cooldowns
+        manager = SkillComboManager(hwnd=0)
+        rng = random.Random(1234)
+        skills = list(skill_combo_config.SKILL_COOLDOWNS)
+        combos = skill_combo_config.get_enabled_combos()
+        mismatches = 0
+        for _ in range(500):
+            clock.advance(rng.uniform(0.0, 15.0))
+            action = rng.random()
+            if action < 0.4:
+                manager.execute_skill(rng.choice(skills), focus=False)
+            elif action < 0.7:
+                manager.try_execute_random_combo()
+            elif action < 0.95:
+                manager.execute_combo(rng.choice(combos))
+            else:
+                manager.reset_cooldowns()
+            expected = _expected_ready_combos(manager)
+            if (manager.has_ready_combo() != bool(expected)
+                    or [c.name for c in manager.get_ready_combos()] != expected
+                    or any(manager.is_skill_ready(s) != (manager.get_skill_cooldown_remaining(s) <= 0)
+                           for s in skills)):
+                mismatches += 1
+        _check(failures, f"Ready checks agree with remaining cooldowns ({mismatches} mismatches)",
+               mismatches == 0)
+    
+    assert not failures, failures
+
+
+def test_stealth_helpers():
+    """Test the pre-drawn stealth delay buffers and probability countdowns."""
+    print("\nSTEALTH HELPERS TEST")
+    failures = []
+    
+    # The settings dialog can save a MIN above its MAX; random.uniform accepted
+    # that, so the numpy-backed buffers must too
+    saved = stealth_config.ACTION_COOLDOWN_MIN, stealth_config.ACTION_COOLDOWN_MAX
+    stealth_config.ACTION_COOLDOWN_MIN, stealth_config.ACTION_COOLDOWN_MAX = 3.0, 2.0
+    try:
+        buf = stealth_config._DelayBuffer('ACTION_COOLDOWN_MIN', 'ACTION_COOLDOWN_MAX')
+        samples = [buf.next() for _ in range(100)]
+        _check(failures, "Reversed MIN/MAX delays stay within the range",
+               all(2.0 <= d <= 3.0 for d in samples))
+    except ValueError as e:
+        _check(failures, f"Reversed MIN/MAX delays stay within the range ({e})", False)
+    finally:
+        stealth_config.ACTION_COOLDOWN_MIN, stealth_config.ACTION_COOLDOWN_MAX = saved
+    
+    # _BernoulliCountdown (should_idle etc.) must answer True at the configured
+    # rate and pick up a changed probability once its current gap runs out
+    saved = stealth_config.IDLE_PROBABILITY
+    try:
+        stealth_config.IDLE_PROBABILITY = 0.0
+        countdown = stealth_config._BernoulliCountdown('IDLE_PROBABILITY')
+        _check(failures, "Probability 0 never answers True",
+               not any(countdown.next() for _ in range(1000)))
+        
+        stealth_config.IDLE_PROBABILITY = 1.0
+        countdown.next()  # redraws the gap with the new setting
+        _check(failures, "Probability 0 -> 1 answers True from the next gap",
+               all(countdown.next() for _ in range(1000)))
+        
+        stealth_config.IDLE_PROBABILITY = 0.0
+        _check(failures, "Probability 1 -> 0 stops answering True after the next True",
+               countdown.next() and not any(countdown.next() for _ in range(1000)))
+        
+        n = 20000
+        for p in (0.02, 0.25, 0.35):
+            stealth_config.IDLE_PROBABILITY = p
+            countdown = stealth_config._BernoulliCountdown('IDLE_PROBABILITY')
+            rate = sum(countdown.next() for _ in range(n)) / n
+            _check(failures, f"Probability {p} answers True at rate {rate:.3f}",
+                   abs(rate - p) < 0.02)
+    finally:
+        stealth_config.IDLE_PROBABILITY = saved
+    
+    # A bad AION_SEED must fall back to an unseeded RNG instead of failing the import
+    for raw, expected in (('42', 42), ('0', None), ('', None), (' ', None), ('abc', None), ('-3', None)):
+        with mock.patch.dict('os.environ', {'AION_SEED': raw}):
+            seed = stealth_config._seed_from_env()
+        _check(failures, f"AION_SEED={raw!r} gives seed {seed!r}", seed == expected)
+    
+    assert not failures, failures
+
+
 if __name__ == "__main__":
     test_skill_combo_system()
+    test_cooldown_tracking()
+    test_stealth_helpers()
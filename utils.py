@@ -1,6 +1,5 @@
 """Utility helpers: window enumeration, image conversions, simple logging helpers."""
-from typing import List, Tuple, Optional
-import io
+from typing import Dict, List, Tuple, Optional
 import sys
 import time
 from PIL import Image
@@ -9,6 +8,13 @@ import cv2
 import pygetwindow as gw
 import win32gui
 
+# How long (seconds) a get_window_rect result is reused before the window is
+# queried again; rects are read every frame by capture, detection and actions
+WINDOW_RECT_TTL = 0.05
+
+# hwnd -> (time.monotonic() when taken, (left, top, width, height))
+_window_rect_cache: Dict[int, Tuple[float, Tuple[int, int, int, int]]] = {}
+
 def list_windows() -> List[Tuple[str, int]]:
     """Return a list of (title, hwnd) for top-level windows with non-empty title."""
     wins = []
@@ -25,40 +31,63 @@ def list_windows() -> List[Tuple[str, int]]:
                 wins.append((title, h))
         wins = []
         win32gui.EnumWindows(_enum, None)
-    # dedupe and return
-    seen = set()
-    out = []
+    # dedupe by hwnd, keeping the first title seen and the enumeration order
+    seen = {}
     for t, h in wins:
-        if h not in seen:
-            out.append((t, h))
-            seen.add(h)
-    return out
+        seen.setdefault(h, t)
+    return [(t, h) for h, t in seen.items()]
 
 def get_window_rect(hwnd: int) -> Optional[Tuple[int, int, int, int]]:
-    """Return (left, top, width, height) for a given hwnd. Returns None if not found."""
+    """Return (left, top, width, height) for a given hwnd. Returns None if not found.
+
+    Results are reused for WINDOW_RECT_TTL seconds; failures are not cached.
+    """
+    now = time.monotonic()
+    cached = _window_rect_cache.get(hwnd)
+    if cached is not None and now - cached[0] < WINDOW_RECT_TTL:
+        return cached[1]
     try:
         rect = win32gui.GetWindowRect(hwnd)
         left, top, right, bottom = rect
-        return left, top, right - left, bottom - top
+        result = left, top, right - left, bottom - top
     except Exception:
         return None
+    _window_rect_cache[hwnd] = (now, result)
+    return result
 
 def pil_from_bgr(bgr: np.ndarray) -> Image.Image:
     """Convert OpenCV BGR numpy image to PIL Image."""
-    rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
-    return Image.fromarray(rgb)
+    # Channel-reversed view; PIL makes the one contiguous copy it needs
+    return Image.fromarray(bgr[..., ::-1])
 
 def jpeg_bytes_from_bgr(bgr: np.ndarray, quality: int = 80) -> bytes:
-    pil = pil_from_bgr(bgr)
-    buf = io.BytesIO()
-    pil.save(buf, format="JPEG", quality=quality)
-    return buf.getvalue()
+    """Encode an OpenCV BGR image as JPEG bytes (empty if encoding fails)."""
+    # cv2 encodes BGR directly, with no RGB copy or intermediate PIL image
+    ok, buf = cv2.imencode(".jpg", bgr, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+    return buf.tobytes() if ok else b""
 
 def resize_keep_aspect(image: np.ndarray, target_max: int) -> np.ndarray:
+    """Downscale so the longer side is at most target_max; smaller images are returned as is."""
     h, w = image.shape[:2]
-    scale = min(target_max / max(w, h), 1.0)
-    if scale == 1.0:
+    m = max(w, h)
+    if m <= target_max:
         return image
-    new_w = int(w * scale)
-    new_h = int(h * scale)
+    scale = target_max / m
+    new_w = max(1, round(w * scale))
+    new_h = max(1, round(h * scale))
+    # This only ever shrinks, which INTER_AREA handles best
     return cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_AREA)
+
+def resize_to(image: np.ndarray, size: Tuple[int, int],
+              dst: Optional[np.ndarray] = None) -> np.ndarray:
+    """Resize to size (width, height), returning image itself if it already matches.
+
+    Uses INTER_AREA when shrinking and INTER_LINEAR when enlarging. Pass a
+    preallocated dst of the target shape to reuse it instead of allocating.
+    """
+    h, w = image.shape[:2]
+    new_w, new_h = size
+    if (w, h) == (new_w, new_h):
+        return image
+    interpolation = cv2.INTER_AREA if new_w <= w and new_h <= h else cv2.INTER_LINEAR
+    return cv2.resize(image, (new_w, new_h), dst=dst, interpolation=interpolation)